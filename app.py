@@ -9,7 +9,7 @@ import os
 
 # --- Backend Imports ---
 from app.main import app as fastapi_app
-from app.database import engine, Base
+from app.database import engine, Base, add_missing_columns
 
 # --- Configuration ---
 API_URL = "http://127.0.0.1:8000/v1/chat"
@@ -19,6 +19,7 @@ DEFAULT_USER_ID = "demo-user-123" # A default value for the user ID field
 def create_db_and_tables():
     print("Creating database and tables...")
     Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine)
     print("Done.")
 
 # --- UI Logic ---
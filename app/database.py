@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -17,4 +17,25 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create a Base class. Our database model classes will inherit from this class.
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+def add_missing_columns(bind=engine):
+    """
+    `Base.metadata.create_all` only creates missing tables, it never changes existing ones.
+    This adds any column that exists on a model but not yet in the database,
+    so an older `sproutie.db` keeps working after new nullable columns are added.
+    """
+    inspector = inspect(bind)
+    with bind.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=bind.dialect)
+                print(f"Adding missing column '{table.name}.{column.name}' to the database...")
+                connection.execute(text(
+                    f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+                ))
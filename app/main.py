@@ -2,11 +2,13 @@
 
 from fastapi import FastAPI
 from .routers import chat
-from .database import engine, Base
+from .database import engine, Base, add_missing_columns
 
 # --- Database Initialization on Startup ---
-# When Uvicorn runs this app, it will create the tables.
+# When Uvicorn runs this app, it will create the tables
+# and add any columns that older databases are missing.
 Base.metadata.create_all(bind=engine)
+add_missing_columns(engine)
 
 # --- FastAPI App Definition ---
 app = FastAPI(
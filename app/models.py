@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Boolean
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
@@ -35,6 +35,13 @@ class ChatMessage(Base):
     input_tokens = Column(Integer, nullable=True, default=0)
     output_tokens = Column(Integer, nullable=True, default=0)
 
+    # Which Gemini model served this (assistant) message, and how long each attempt took.
+    # Used to tune the hedge delay in gemini_service.
+    model_name = Column(String, nullable=True)
+    primary_latency_ms = Column(Integer, nullable=True)
+    fallback_latency_ms = Column(Integer, nullable=True)
+    hedge_fired = Column(Boolean, nullable=True, default=False)
+
     # This creates the "many-to-one" side of the relationship.
     session = relationship("ChatSession", back_populates="messages")
 
@@ -135,7 +135,11 @@ async def handle_chat(
         role="assistant",
         content=service_response.response_text,
         input_tokens=service_response.input_tokens,
-        output_tokens=service_response.output_tokens
+        output_tokens=service_response.output_tokens,
+        model_name=service_response.model_name,
+        primary_latency_ms=service_response.primary_latency_ms,
+        fallback_latency_ms=service_response.fallback_latency_ms,
+        hedge_fired=service_response.hedge_fired
     )
     db.add(assistant_message)
     db.commit()
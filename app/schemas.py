@@ -22,6 +22,13 @@ class GeminiServiceResponse(BaseModel):
     response_text: str
     input_tokens: int
     output_tokens: int
+    # Which model actually produced the answer (None if every attempt failed)
+    model_name: Optional[str] = None
+    # Latency of each attempt in milliseconds, including attempts that lost and were cancelled
+    primary_latency_ms: Optional[int] = None
+    fallback_latency_ms: Optional[int] = None
+    # True if a request was also sent to the fallback model
+    hedge_fired: bool = False
 
 class ChatMessageResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
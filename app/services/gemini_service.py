@@ -3,10 +3,11 @@ from dotenv import load_dotenv
 from typing import List
 from fastapi import UploadFile
 import google.genai as genai
-from google.genai import types
+from google.genai import types, errors
 from app import models
 from app.schemas import GeminiServiceResponse
 import asyncio
+import time
 
 # Load environment variables from .env file
 load_dotenv()
@@ -21,6 +22,26 @@ except Exception as e:
     client = None
 
 MODEL = 'gemini-2.5-flash-lite-preview-06-17'
+# Stable model used when the preview MODEL is slow or failing
+FALLBACK_MODEL = os.getenv("GEMINI_FALLBACK_MODEL", "gemini-2.5-flash-lite")
+
+def _float_env(name, default):
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Warning: {name}={value!r} is not a number. Using {default}.")
+        return default
+
+# Deadline (seconds) for each individual generate_content call
+REQUEST_TIMEOUT_SECONDS = _float_env("GEMINI_REQUEST_TIMEOUT_SECONDS", 20.0)
+# If the primary call hasn't finished after this many seconds, fire a second
+# request to FALLBACK_MODEL and keep whichever answers first.
+# Leave unset to disable hedging (the fallback is then only used on failure).
+HEDGE_DELAY_SECONDS = _float_env("GEMINI_HEDGE_DELAY_SECONDS", None)
+
 # It's good practice to load the system prompt from a file
 def load_system_prompt():
     try:
@@ -66,6 +87,97 @@ async def upload_file_to_gemini(
         print(f"An error occurred during file upload to Gemini: {e}")
         return None
 
+async def _timed_generate(model, contents, config, attempt_latencies):
+    """
+    Calls generate_content on a single model with a deadline, recording how long it took.
+    The elapsed time is recorded even when the attempt fails or is cancelled, so a
+    losing primary still tells us how long it had been running when the hedge won.
+    """
+    start = time.perf_counter()
+    try:
+        return await asyncio.wait_for(
+            client.aio.models.generate_content(
+                model=model,
+                contents=contents,
+                config=config
+            ),
+            timeout=REQUEST_TIMEOUT_SECONDS
+        )
+    finally:
+        attempt_latencies[model] = int((time.perf_counter() - start) * 1000)
+
+def _is_retryable(error):
+    """
+    Only timeouts, 5xx and 429 are worth sending to the fallback model.
+    Anything else (e.g. a 400 for an expired file URI) would just fail again.
+    """
+    if isinstance(error, (asyncio.TimeoutError, errors.ServerError)):
+        return True
+    return isinstance(error, errors.APIError) and error.code == 429
+
+async def _generate_with_fallback(contents, config, attempt_latencies):
+    """
+    Runs the primary MODEL and, after HEDGE_DELAY_SECONDS (or as soon as the
+    primary fails with a retryable error), a backup request to FALLBACK_MODEL.
+    Returns (model_name, response) for the first attempt that succeeds and
+    cancels the other one. Raises the last error if every attempt fails.
+    """
+    tasks = {
+        asyncio.create_task(_timed_generate(MODEL, contents, config, attempt_latencies)): MODEL
+    }
+    fallback_started = not FALLBACK_MODEL or FALLBACK_MODEL == MODEL
+    last_error = None
+
+    try:
+        while tasks:
+            # Only wait for the hedge delay while the fallback hasn't been fired yet
+            timeout = HEDGE_DELAY_SECONDS if not fallback_started else None
+            done, _ = await asyncio.wait(
+                tasks.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            # Retrieve every finished task so no exception goes unobserved
+            winner = None
+            for task in done:
+                model_name = tasks.pop(task)
+                try:
+                    response = task.result()
+                except Exception as e:
+                    print(f"Gemini call to '{model_name}' failed: {e!r}")
+                    last_error = e
+                    continue
+                if winner is None or model_name == MODEL:
+                    winner = (model_name, response)
+            if winner:
+                return winner
+
+            if fallback_started:
+                continue
+            if done and not _is_retryable(last_error):
+                # The primary failed in a way the fallback can't fix
+                break
+
+            # Hedge delay elapsed, or the primary hit a retryable error: bring in the fallback
+            fallback_started = True
+            tasks[asyncio.create_task(
+                _timed_generate(FALLBACK_MODEL, contents, config, attempt_latencies)
+            )] = FALLBACK_MODEL
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let the cancelled attempts record their latency before we report it
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    raise last_error
+
+def _latency_fields(attempt_latencies):
+    fallback_fired = bool(FALLBACK_MODEL) and FALLBACK_MODEL != MODEL and FALLBACK_MODEL in attempt_latencies
+    return dict(
+        primary_latency_ms=attempt_latencies.get(MODEL),
+        fallback_latency_ms=attempt_latencies.get(FALLBACK_MODEL) if fallback_fired else None,
+        hedge_fired=fallback_fired
+    )
+
 async def get_chat_response(
     history: List[models.ChatMessage], 
     session_files: List[tuple[str, str]]
@@ -118,21 +230,24 @@ async def get_chat_response(
 
     api_history.append(types.Content(role='user', parts=final_prompt_parts))
     
+    attempt_latencies = {}
     try:
-        response = await client.aio.models.generate_content(
-            model=MODEL,
+        model_name, response = await _generate_with_fallback(
             contents=api_history, # Pass the list of Content objects
             config=types.GenerateContentConfig(
                 system_instruction=SYSTEM_PROMPT,
                 temperature=0.7,
                 max_output_tokens=600
-            )
+            ),
+            attempt_latencies=attempt_latencies
         )
         usage = response.usage_metadata
         return GeminiServiceResponse(
             response_text=response.text,
             input_tokens=usage.prompt_token_count,
-            output_tokens=usage.candidates_token_count
+            output_tokens=usage.candidates_token_count,
+            model_name=model_name,
+            **_latency_fields(attempt_latencies)
         )
 
     except Exception as e:
@@ -140,5 +255,6 @@ async def get_chat_response(
         return GeminiServiceResponse(
             response_text="Oh no! My digital roots are tangled. I couldn't process that. Please try again. 😵‍💫",
             input_tokens=0,
-            output_tokens=0
+            output_tokens=0,
+            **_latency_fields(attempt_latencies)
         )
\ No newline at end of file
@@ -0,0 +1,31 @@
+from sqlalchemy import create_engine, inspect, text
+
+from app import models  # noqa: F401 - registers the tables on Base.metadata
+from app.database import Base, add_missing_columns
+
+
+def test_add_missing_columns_upgrades_old_table(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    # A chat_messages table from before the latency columns existed
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE chat_messages ("
+            "id VARCHAR PRIMARY KEY, session_id VARCHAR NOT NULL, role VARCHAR NOT NULL, "
+            "content TEXT NOT NULL, image_url VARCHAR, created_at DATETIME, "
+            "input_tokens INTEGER, output_tokens INTEGER)"
+        ))
+        connection.execute(text(
+            "INSERT INTO chat_messages (id, session_id, role, content) "
+            "VALUES ('1', 's', 'user', 'hi')"
+        ))
+
+    Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine)
+
+    columns = {column["name"] for column in inspect(engine).get_columns("chat_messages")}
+    assert {"model_name", "primary_latency_ms", "fallback_latency_ms", "hedge_fired"} <= columns
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT content FROM chat_messages")).scalar() == "hi"
+
+    # Running it again on an up-to-date database is a no-op
+    add_missing_columns(engine)
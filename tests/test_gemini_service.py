@@ -0,0 +1,115 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.genai import errors
+
+from app.services import gemini_service
+
+PRIMARY = gemini_service.MODEL
+FALLBACK = "fallback-model"
+
+
+class FakeModels:
+    """Stands in for client.aio.models; each model sleeps, then returns or raises."""
+
+    def __init__(self, behaviour):
+        self.behaviour = behaviour
+        self.calls = []
+
+    async def generate_content(self, model, contents, config):
+        self.calls.append(model)
+        delay, outcome = self.behaviour[model]
+        await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    monkeypatch.setattr(gemini_service, "FALLBACK_MODEL", FALLBACK)
+    monkeypatch.setattr(gemini_service, "HEDGE_DELAY_SECONDS", 0.1)
+    monkeypatch.setattr(gemini_service, "REQUEST_TIMEOUT_SECONDS", 1.0)
+
+    def install(behaviour):
+        models = FakeModels(behaviour)
+        monkeypatch.setattr(
+            gemini_service, "client", SimpleNamespace(aio=SimpleNamespace(models=models))
+        )
+        return models
+
+    return install
+
+
+def run(attempt_latencies):
+    return asyncio.run(
+        gemini_service._generate_with_fallback(None, None, attempt_latencies)
+    )
+
+
+def test_primary_wins_before_hedge(fake_client):
+    models = fake_client({PRIMARY: (0.01, "primary"), FALLBACK: (0.01, "fallback")})
+    latencies = {}
+
+    assert run(latencies) == (PRIMARY, "primary")
+    assert models.calls == [PRIMARY]
+    assert list(latencies) == [PRIMARY]
+    assert gemini_service._latency_fields(latencies)["hedge_fired"] is False
+
+
+def test_hedge_wins_and_primary_is_cancelled(fake_client):
+    models = fake_client({PRIMARY: (0.5, "primary"), FALLBACK: (0.05, "fallback")})
+    latencies = {}
+
+    assert run(latencies) == (FALLBACK, "fallback")
+    assert models.calls == [PRIMARY, FALLBACK]
+    # The cancelled primary still reports how long it had been running
+    assert 100 <= latencies[PRIMARY] < 500
+    assert latencies[FALLBACK] < latencies[PRIMARY]
+    assert gemini_service._latency_fields(latencies)["hedge_fired"] is True
+
+
+def test_primary_failure_starts_fallback_immediately(fake_client):
+    models = fake_client({
+        PRIMARY: (0.01, errors.ServerError(503, {})),
+        FALLBACK: (0.01, "fallback"),
+    })
+    latencies = {}
+
+    assert run(latencies) == (FALLBACK, "fallback")
+    assert models.calls == [PRIMARY, FALLBACK]
+    # Fallback was not held back until the hedge delay
+    assert latencies[PRIMARY] + latencies[FALLBACK] < 100
+
+
+def test_primary_timeout_falls_back(fake_client, monkeypatch):
+    monkeypatch.setattr(gemini_service, "HEDGE_DELAY_SECONDS", None)
+    monkeypatch.setattr(gemini_service, "REQUEST_TIMEOUT_SECONDS", 0.05)
+    models = fake_client({PRIMARY: (0.5, "primary"), FALLBACK: (0.01, "fallback")})
+
+    assert run({}) == (FALLBACK, "fallback")
+    assert models.calls == [PRIMARY, FALLBACK]
+
+
+def test_non_retryable_error_skips_fallback(fake_client):
+    models = fake_client({
+        PRIMARY: (0.01, errors.ClientError(400, {})),
+        FALLBACK: (0.01, "fallback"),
+    })
+
+    with pytest.raises(errors.ClientError):
+        run({})
+    assert models.calls == [PRIMARY]
+
+
+def test_both_attempts_fail(fake_client):
+    fake_client({
+        PRIMARY: (0.01, errors.ClientError(429, {})),
+        FALLBACK: (0.01, errors.ServerError(500, {})),
+    })
+    latencies = {}
+
+    with pytest.raises(errors.ServerError):
+        run(latencies)
+    assert set(latencies) == {PRIMARY, FALLBACK}